@@ -1,11 +1,33 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.deps import get_engine, shutdown_engine
 from api.routes import extraction, game
+from api.schemas import StatusResponse
+import config
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if config.OUTPUT_BASE.exists():
+        try:
+            await asyncio.to_thread(get_engine)
+        except Exception:
+            logger.exception("GameEngine 预热失败，将在首次游戏请求时重试")
+    yield
+    await asyncio.to_thread(shutdown_engine)
+
 
 app = FastAPI(
     title="WhatIf API",
     description="WhatIf 互动式小说引擎 API",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -20,6 +42,9 @@ app.include_router(game.router)
 app.include_router(extraction.router)
 
 
-@app.get("/api/health")
+_HEALTH_OK = StatusResponse(status="ok")
+
+
+@app.get("/api/health", response_model=StatusResponse)
 async def health_check():
-    return {"status": "ok"}
+    return _HEALTH_OK
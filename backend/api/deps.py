@@ -1,15 +1,35 @@
+import asyncio
+import threading
+
 from runtime.game import GameEngine
 import config
 
 _engine: GameEngine | None = None
+_engine_lock = threading.Lock()
 
 
 def get_engine() -> GameEngine:
     global _engine
     if _engine is None:
-        if not config.OUTPUT_BASE.exists():
-            raise RuntimeError(
-                "WorldPkg 不存在，请先运行 Phase 1 数据提取: python extract.py ../data/novels/xxx.txt"
-            )
-        _engine = GameEngine(config.OUTPUT_BASE, config.SAVES_DIR)
+        with _engine_lock:
+            if _engine is None:
+                if not config.OUTPUT_BASE.exists():
+                    raise RuntimeError(
+                        "WorldPkg 不存在，请先运行 Phase 1 数据提取: python extract.py ../data/novels/xxx.txt"
+                    )
+                _engine = GameEngine(config.OUTPUT_BASE, config.SAVES_DIR)
     return _engine
+
+
+async def engine_dependency() -> GameEngine:
+    if _engine is not None:
+        return _engine
+    return await asyncio.to_thread(get_engine)
+
+
+def shutdown_engine() -> None:
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.shutdown()
+            _engine = None
@@ -1,13 +1,18 @@
 from fastapi import APIRouter
 
+from api.schemas import MessageResponse, StatusResponse
+
 router = APIRouter(prefix="/api/extraction", tags=["extraction"])
 
+_STATUS_NOT_STARTED = StatusResponse(status="not_started")
+_NOT_IMPLEMENTED = MessageResponse(message="Extraction API not yet implemented")
+
 
-@router.get("/status")
+@router.get("/status", response_model=StatusResponse)
 async def extraction_status():
-    return {"status": "not_started"}
+    return _STATUS_NOT_STARTED
 
 
-@router.post("/start")
+@router.post("/start", response_model=MessageResponse)
 async def start_extraction():
-    return {"message": "Extraction API not yet implemented"}
+    return _NOT_IMPLEMENTED
@@ -1,11 +1,13 @@
 import asyncio
-import json
+import weakref
+from typing import AsyncIterator, Callable
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
-from api.deps import get_engine
+from api.deps import engine_dependency
 from api.schemas import (
     EventInfo,
     GameStateResponse,
@@ -31,159 +33,117 @@ class SaveRequest(BaseModel):
     description: str = ""
 
 
-def _state_event(engine: GameEngine) -> str:
+_CHUNK_PREFIX = b"event: chunk\ndata: "
+_ERROR_PREFIX = b"event: error\ndata: "
+_STATE_PREFIX = b"event: state\ndata: "
+_FRAME_END = b"\n\n"
+_DONE_FRAME = b"event: done\ndata: {}\n\n"
+
+
+def _state_event(engine: GameEngine) -> bytes:
     snap = engine.response_state
-    return json.dumps({
+    return to_json({
         "phase": snap.phase,
         "eventId": snap.event_id,
         "turn": snap.turn,
         "awaitingNextEvent": snap.awaiting_next_event,
         "gameEnded": snap.game_ended,
-    }, ensure_ascii=False)
+    })
 
 
-@router.post("/start")
-async def start_game(engine: GameEngine = Depends(get_engine)):
+async def _narrative_stream(
+    engine: GameEngine,
+    run: Callable[[Callable[[str], None]], object],
+) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    chunk_queue: asyncio.Queue[str | None] = asyncio.Queue()
 
-    async def event_stream():
-        loop = asyncio.get_event_loop()
-        chunk_queue: asyncio.Queue[str | None] = asyncio.Queue()
+    def on_chunk(text: str) -> None:
+        loop.call_soon_threadsafe(chunk_queue.put_nowait, text)
 
-        def on_chunk(text: str) -> None:
-            loop.call_soon_threadsafe(chunk_queue.put_nowait, text)
+    future = loop.run_in_executor(None, run, on_chunk)
+    future.add_done_callback(lambda _: chunk_queue.put_nowait(None))
 
-        future = loop.run_in_executor(None, engine.new_game, on_chunk)
+    while (chunk := await chunk_queue.get()) is not None:
+        yield _CHUNK_PREFIX + to_json({"text": chunk}) + _FRAME_END
 
-        while not future.done():
-            try:
-                chunk = await asyncio.wait_for(chunk_queue.get(), timeout=0.1)
-                data = json.dumps({"text": chunk}, ensure_ascii=False)
-                yield f"event: chunk\ndata: {data}\n\n"
-            except asyncio.TimeoutError:
-                continue
+    try:
+        await future
+    except Exception as e:
+        yield _ERROR_PREFIX + to_json({"message": str(e)}) + _FRAME_END
+        yield _DONE_FRAME
+        return
 
-        try:
-            await future
-        except Exception as e:
-            err = json.dumps({"message": str(e)}, ensure_ascii=False)
-            yield f"event: error\ndata: {err}\n\n"
-            yield f"event: done\ndata: {{}}\n\n"
-            return
+    yield _STATE_PREFIX + _state_event(engine) + _FRAME_END
+    yield _DONE_FRAME
 
-        while not chunk_queue.empty():
-            chunk = chunk_queue.get_nowait()
-            data = json.dumps({"text": chunk}, ensure_ascii=False)
-            yield f"event: chunk\ndata: {data}\n\n"
 
-        yield f"event: state\ndata: {_state_event(engine)}\n\n"
-        yield f"event: done\ndata: {{}}\n\n"
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+@router.post("/start")
+async def start_game(engine: GameEngine = Depends(engine_dependency)):
+    return StreamingResponse(
+        _narrative_stream(engine, engine.new_game),
+        media_type="text/event-stream",
+    )
 
 
 @router.post("/action")
 async def player_action(
     request: ActionRequest,
-    engine: GameEngine = Depends(get_engine),
+    engine: GameEngine = Depends(engine_dependency),
 ):
 
-    async def event_stream():
-        loop = asyncio.get_event_loop()
-        chunk_queue: asyncio.Queue[str | None] = asyncio.Queue()
-
-        def on_chunk(text: str) -> None:
-            loop.call_soon_threadsafe(chunk_queue.put_nowait, text)
-
+    def run(on_chunk: Callable[[str], None]) -> str:
         engine.on_narrative_chunk = on_chunk
-
-        future = loop.run_in_executor(
-            None, engine.process_input, request.action
-        )
-
-        while not future.done():
-            try:
-                chunk = await asyncio.wait_for(chunk_queue.get(), timeout=0.1)
-                data = json.dumps({"text": chunk}, ensure_ascii=False)
-                yield f"event: chunk\ndata: {data}\n\n"
-            except asyncio.TimeoutError:
-                continue
-
         try:
-            await future
-        except Exception as e:
-            err = json.dumps({"message": str(e)}, ensure_ascii=False)
-            yield f"event: error\ndata: {err}\n\n"
-            yield f"event: done\ndata: {{}}\n\n"
-            return
-
-        while not chunk_queue.empty():
-            chunk = chunk_queue.get_nowait()
-            data = json.dumps({"text": chunk}, ensure_ascii=False)
-            yield f"event: chunk\ndata: {data}\n\n"
+            return engine.process_input(request.action)
+        finally:
+            engine.on_narrative_chunk = None
 
-        engine.on_narrative_chunk = None
-
-        yield f"event: state\ndata: {_state_event(engine)}\n\n"
-        yield f"event: done\ndata: {{}}\n\n"
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return StreamingResponse(
+        _narrative_stream(engine, run),
+        media_type="text/event-stream",
+    )
 
 
 @router.post("/continue")
-async def continue_game(engine: GameEngine = Depends(get_engine)):
-
-    async def event_stream():
-        loop = asyncio.get_event_loop()
-        chunk_queue: asyncio.Queue[str | None] = asyncio.Queue()
-
-        def on_chunk(text: str) -> None:
-            loop.call_soon_threadsafe(chunk_queue.put_nowait, text)
-
-        future = loop.run_in_executor(None, engine.continue_game, on_chunk)
-
-        while not future.done():
-            try:
-                chunk = await asyncio.wait_for(chunk_queue.get(), timeout=0.1)
-                data = json.dumps({"text": chunk}, ensure_ascii=False)
-                yield f"event: chunk\ndata: {data}\n\n"
-            except asyncio.TimeoutError:
-                continue
+async def continue_game(engine: GameEngine = Depends(engine_dependency)):
+    return StreamingResponse(
+        _narrative_stream(engine, engine.continue_game),
+        media_type="text/event-stream",
+    )
 
-        try:
-            await future
-        except Exception as e:
-            err = json.dumps({"message": str(e)}, ensure_ascii=False)
-            yield f"event: error\ndata: {err}\n\n"
-            yield f"event: done\ndata: {{}}\n\n"
-            return
 
-        while not chunk_queue.empty():
-            chunk = chunk_queue.get_nowait()
-            data = json.dumps({"text": chunk}, ensure_ascii=False)
-            yield f"event: chunk\ndata: {data}\n\n"
+_event_info_cache: weakref.WeakKeyDictionary[GameEngine, dict[str, EventInfo | None]] = (
+    weakref.WeakKeyDictionary()
+)
 
-        yield f"event: state\ndata: {_state_event(engine)}\n\n"
-        yield f"event: done\ndata: {{}}\n\n"
 
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+def _event_info(engine: GameEngine, event_id: str) -> EventInfo | None:
+    cache = _event_info_cache.get(engine)
+    if cache is None:
+        cache = _event_info_cache[engine] = {}
+    if event_id in cache:
+        return cache[event_id]
+    event = engine.world.get_event(event_id)
+    info = None
+    if event:
+        info = EventInfo(
+            id=event.id,
+            decision_text=event.decision_text,
+            goal=event.goal,
+            importance=event.importance.value,
+            type=event.type,
+        )
+    cache[event_id] = info
+    return info
 
 
 @router.get("/state", response_model=GameStateResponse)
-async def game_state(engine: GameEngine = Depends(get_engine)):
+async def game_state(engine: GameEngine = Depends(engine_dependency)):
     snap = engine.response_state
-    event_info = None
-    if snap.event_id:
-        event = engine.world.get_event(snap.event_id)
-        if event:
-            event_info = EventInfo(
-                id=event.id,
-                decision_text=event.decision_text,
-                goal=event.goal,
-                importance=event.importance.value,
-                type=event.type,
-            )
-
-    return GameStateResponse(
+    event_info = _event_info(engine, snap.event_id) if snap.event_id else None
+
+    return GameStateResponse.model_construct(
         phase=snap.phase,
         event=event_info,
         turn=snap.turn,
@@ -196,29 +156,26 @@ async def game_state(engine: GameEngine = Depends(get_engine)):
 @router.post("/save", response_model=MessageResponse)
 async def save_game(
     request: SaveRequest,
-    engine: GameEngine = Depends(get_engine),
+    engine: GameEngine = Depends(engine_dependency),
 ):
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(
-        None, engine.save_game, request.slot, request.description
-    )
-    return MessageResponse(message=result)
+    result = await asyncio.to_thread(engine.save_game, request.slot, request.description)
+    return MessageResponse.model_construct(message=result)
 
 
 @router.get("/saves", response_model=SaveListResponse)
-async def list_saves(engine: GameEngine = Depends(get_engine)):
-    return SaveListResponse(saves=engine.list_saves())
+async def list_saves(engine: GameEngine = Depends(engine_dependency)):
+    saves = await asyncio.to_thread(engine.list_saves)
+    return SaveListResponse(saves=saves)
 
 
 @router.post("/load", response_model=NarrativeResponse)
 async def load_game(
     request: LoadRequest,
-    engine: GameEngine = Depends(get_engine),
+    engine: GameEngine = Depends(engine_dependency),
 ):
-    loop = asyncio.get_event_loop()
-    text = await loop.run_in_executor(None, engine.load_game, request.slot)
+    text = await asyncio.to_thread(engine.load_game, request.slot)
     snap = engine.response_state
-    return NarrativeResponse(
+    return NarrativeResponse.model_construct(
         text=text,
         phase=snap.phase,
         event_id=snap.event_id,
@@ -57,3 +57,8 @@ class SaveListResponse(CamelModel):
 class MessageResponse(CamelModel):
 
     message: str
+
+
+class StatusResponse(CamelModel):
+
+    status: str
@@ -6,13 +6,17 @@ from typing import Any
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 load_dotenv()
 
+_RESERVED_PARAM_KEYS = frozenset({
+    "model", "messages", "temperature", "stream", "response_format", "max_tokens",
+})
+
 
 class LLMConfig(BaseModel):
-    model_config = {"frozen": True, "extra": "forbid"}
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     model: str
     temperature: float = 0.2
@@ -23,8 +27,7 @@ class LLMConfig(BaseModel):
 
     @model_validator(mode="after")
     def _check_reserved_keys(self) -> "LLMConfig":
-        reserved = {"model", "messages", "temperature", "stream", "response_format", "max_tokens"}
-        conflict = reserved & self.extra_params.keys()
+        conflict = _RESERVED_PARAM_KEYS & self.extra_params.keys()
         if conflict:
             raise ValueError(f"extra_params 不允许覆盖保留键: {conflict}")
         return self
@@ -60,6 +63,8 @@ SESSION_LOG_CATEGORIES: set[str] | str = "ALL"
 
 LOREBOOK_CACHE_TTL = "3600s"
 
+STAGE3_MAX_WORKERS = 4
+
 
 def _load_llm_configs() -> dict[str, LLMConfig]:
     config_path = PROJECT_ROOT / "llm_config.yaml"
@@ -7,17 +7,14 @@ import json_repair
 import litellm
 from litellm import completion, get_supported_openai_params, supports_response_schema
 from pydantic import BaseModel, ValidationError
-from dotenv import load_dotenv
 
 import config
 
-load_dotenv()
-
 litellm.drop_params = False
 
 try:
     from runtime.game_logger import glog as _glog
-except Exception:
+except ImportError:
     _glog = None
 
 T = TypeVar("T", bound=BaseModel)
@@ -34,6 +31,19 @@ def _check_native_schema(model: str, custom_provider: str | None) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _load_json_system_template() -> str:
+    template_path = config.CORE_PROMPTS_DIR / "json_output_system.txt"
+    return template_path.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=64)
+def _json_system_prompt(response_model: type[BaseModel]) -> str:
+    schema = response_model.model_json_schema()
+    schema_str = json.dumps(schema, ensure_ascii=False, indent=2)
+    return _load_json_system_template().replace("{schema_str}", schema_str)
+
+
 _MODEL_MAX_OUTPUT: dict[str, int] = {
     "dashscope/qwen-max-latest": 8192,
     "dashscope/qwen-max": 8192,
@@ -89,15 +99,8 @@ class LLMClient:
         cp = model.split("/", 1)[0] if "/" in model else None
         return not _check_native_schema(model, cp)
 
-    def _load_json_system_template(self) -> str:
-        template_path = config.CORE_PROMPTS_DIR / "json_output_system.txt"
-        return template_path.read_text(encoding="utf-8")
-
     def _build_json_system_prompt(self, response_model: Type[T]) -> str:
-        template = self._load_json_system_template()
-        schema = response_model.model_json_schema()
-        schema_str = json.dumps(schema, ensure_ascii=False, indent=2)
-        return template.replace("{schema_str}", schema_str)
+        return _json_system_prompt(response_model)
 
     def _clean_json_response(self, content: str) -> str:
         content = content.strip()
@@ -116,7 +119,7 @@ class LLMClient:
         try:
             return response_model.model_validate_json(content)
         except ValidationError:
-            if _glog:
+            if _glog and _glog.enabled("LLM_JSON_REPAIR"):
                 _glog.log("LLM_JSON_REPAIR", {
                     "model": response_model.__name__,
                     "content_preview": content[:200],
@@ -151,7 +154,7 @@ class LLMClient:
         response = completion(**call_params)
         result = response.choices[0].message.content
 
-        if _glog and log:
+        if log and _glog and _glog.enabled("LLM_CALL"):
             _glog.log("LLM_CALL", {
                 "method": "generate",
                 "model": model,
@@ -221,7 +224,7 @@ class LLMClient:
 
         parsed = self._parse_or_repair(content, response_model)
 
-        if _glog:
+        if _glog and _glog.enabled("LLM_CALL"):
             _glog.log("LLM_CALL", {
                 "method": "generate_structured",
                 "model": model,
@@ -332,7 +335,7 @@ class LLMClient:
 
         parsed = self._parse_or_repair(content, response_model)
 
-        if _glog:
+        if _glog and _glog.enabled("LLM_CALL"):
             _glog.log("LLM_CALL", {
                 "method": "generate_structured_with_cache",
                 "model": model,
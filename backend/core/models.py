@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EventImportance(str, Enum):
@@ -244,7 +244,7 @@ class Precondition(BaseModel):
     from_value: Optional[str] = Field(default=None, description="事件开始前的归属（unnecessary 实体置 null）", alias="from")
     granularity: Literal["named", "functional"]
 
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class Effect(BaseModel):
@@ -255,7 +255,7 @@ class Effect(BaseModel):
     to: Optional[str] = Field(default=None, description="变化后的归属（unnecessary 实体置 null）")
     granularity: Literal["named", "functional"]
 
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class EventTransition(BaseModel):
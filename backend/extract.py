@@ -1,5 +1,6 @@
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Type
@@ -23,14 +24,14 @@ from preprocessing.segmentation.decision_text_extractor import DecisionTextExtra
 from preprocessing.lorebook import LorebookExtractor
 from preprocessing.entity_transition import (
     scan_entities, build_stage3_registry,
-    BatchManager, TokenEstimator, compute_fixed_costs,
+    BatchManager, BatchInfo, TokenEstimator, compute_fixed_costs,
 )
 from preprocessing.entity_transition.field_extractor import extract_events_for_stage3
 from preprocessing.entity_transition.necessity_grader import NecessityGrader
 from preprocessing.entity_transition.transition_annotator import TransitionAnnotator
 from preprocessing.entity_transition.cross_validator import CrossValidator
 from preprocessing.entity_transition.repairer import Repairer, merge_repairs
-from preprocessing.entity_transition.validators import validate_transitions
+from preprocessing.entity_transition.validators import build_valid_names, validate_transitions
 import config
 
 
@@ -89,7 +90,11 @@ def _all_decision_texts_present(events: EventData) -> bool:
     return True
 
 
-def main(input_path: str, output_dir: str | None = None):
+def main(
+    input_path: str,
+    output_dir: str | None = None,
+    stage3_workers: int = config.STAGE3_MAX_WORKERS,
+):
     input_file = Path(input_path)
     output_path = Path(output_dir) if output_dir else config.OUTPUT_BASE / input_file.stem
 
@@ -206,7 +211,7 @@ def main(input_path: str, output_dir: str | None = None):
         transitions = load_json(transitions_file, TransitionData)
     else:
         transitions = _run_stage3(
-            llm, events, lorebook, sentences, debug_dir
+            llm, events, lorebook, sentences, debug_dir, stage3_workers
         )
         save_json(transitions, transitions_file, by_alias=True)
 
@@ -243,11 +248,12 @@ def _run_stage3(
     lorebook: LorebookData,
     sentences: SentenceData,
     debug_dir: Path,
+    max_workers: int,
 ) -> TransitionData:
 
-    events_json = extract_events_for_stage3(events)
-    events_slim = json.loads(events_json)
+    events_slim = extract_events_for_stage3(events)
     registry = build_stage3_registry(lorebook)
+    valid_names = build_valid_names(registry)
 
     print("\n[Step 3.1] 实体扫描...")
     candidates = scan_entities(events_slim, registry, sentences)
@@ -269,102 +275,27 @@ def _run_stage3(
             f"{reg_size} registry 实体, overlap={bi.overlap_count}"
         )
 
-    batch_results: list[list[dict]] = []
-
-    for batch_idx, batch_info in enumerate(batches):
-        print(
-            f"\n--- 批次 {batch_idx + 1}/{len(batches)} "
-            f"({len(batch_info.events)} 事件) ---"
-        )
-
-        batch_events_json = json.dumps(
-            batch_info.events, ensure_ascii=False, indent=2
-        )
-        batch_candidates_json = json.dumps(
-            batch_info.candidates_subset, ensure_ascii=False, indent=2
-        )
-        batch_registry_json = json.dumps(
-            batch_info.registry_subset, ensure_ascii=False, indent=2
-        )
-
-                                           
-        print("[Call 3.2] 必要性 + 颗粒度判断...")
-        necessity = NecessityGrader(llm).extract(
-            events_json=batch_events_json,
-            candidates_json=batch_candidates_json,
-            events_slim=batch_info.events,
-        )
-        if batch_idx == 0:
-            save_json(necessity, debug_dir / "necessary.json")
-
-        necessary_json = necessity.model_dump_json(indent=2)
-
-        print("[Call 3.3] 转移标注...")
-        transitions_draft = TransitionAnnotator(llm).extract(
-            events_json=batch_events_json,
-            necessary_json=necessary_json,
-            registry_json=batch_registry_json,
-            registry=registry,
-        )
-        draft_dicts = [
-            {
-                "event_id": t.event_id,
-                "preconditions": [
-                    p.model_dump(by_alias=True) for p in t.preconditions
-                ],
-                "effects": [
-                    e.model_dump(by_alias=True) for e in t.effects
-                ],
-            }
-            for t in transitions_draft.transitions
-        ]
-        if batch_idx == 0:
-            save_json(draft_dicts, debug_dir / "transitions_draft.json")
-
-        print("[Call 3.4] 交叉验证...")
-        validation = CrossValidator(llm).extract(
-            events_json=batch_events_json,
-            transitions_draft=draft_dicts,
-            events_slim=batch_info.events,
-            registry_json=batch_registry_json,
-            necessary_json=necessary_json,
-        )
-        if batch_idx == 0:
-            save_json(validation, debug_dir / "validation_report.json")
-
-        has_errors = any(r.errors for r in validation.reports)
-
-        if has_errors:
-            print("[Call 3.5] 发现错误，修复中...")
-            error_eids = {r.event_id for r in validation.reports if r.errors}
-            problematic = [e for e in draft_dicts if e["event_id"] in error_eids]
-            error_reports = [
-                r.model_dump() for r in validation.reports if r.errors
-            ]
-
-            repaired = Repairer(llm).extract(
-                problematic_events=problematic,
-                validation_reports=error_reports,
-                registry_json=batch_registry_json,
+    grader = NecessityGrader(llm)
+    annotator = TransitionAnnotator(llm)
+    validator = CrossValidator(llm)
+    repairer = Repairer(llm)
+
+    print(f"\n  - 并发处理 {len(batches)} 个批次...")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                _run_stage3_batch,
+                grader, annotator, validator, repairer,
+                batch_idx, len(batches), batch_info,
+                registry, valid_names, debug_dir,
             )
-            final_dicts = merge_repairs(draft_dicts, repaired)
-            if batch_idx == 0:
-                save_json(final_dicts, debug_dir / "repairs.json")
-
-            remaining_errors = validate_transitions(final_dicts, registry)
-            if remaining_errors:
-                print(f"  ⚠ 修复后仍有 {len(remaining_errors)} 个问题")
-                for e in remaining_errors[:3]:
-                    print(f"    · {e}")
-        else:
-            print("  - 验证通过，无需修复")
-            final_dicts = draft_dicts
-
-        batch_results.append(final_dicts)
+            for batch_idx, batch_info in enumerate(batches)
+        ]
+        batch_results: list[list[dict]] = [f.result() for f in futures]
 
     merged = batch_mgr.merge_results(batch_results, batches)
 
-    final_errors = validate_transitions(merged, registry)
+    final_errors = validate_transitions(merged, registry, valid_names)
     if final_errors:
         print(f"\n  ⚠ 合并后全量验证发现 {len(final_errors)} 个问题")
         for e in final_errors[:5]:
@@ -373,17 +304,117 @@ def _run_stage3(
     return TransitionData.model_validate({"transitions": merged})
 
 
+def _run_stage3_batch(
+    grader: NecessityGrader,
+    annotator: TransitionAnnotator,
+    validator: CrossValidator,
+    repairer: Repairer,
+    batch_idx: int,
+    batch_count: int,
+    batch_info: BatchInfo,
+    registry: dict,
+    valid_names: frozenset[str],
+    debug_dir: Path,
+) -> list[dict]:
+    label = f"[批次 {batch_idx + 1}/{batch_count}]"
+    print(f"\n--- {label} ({len(batch_info.events)} 事件) ---")
+
+    batch_events_json = json.dumps(
+        batch_info.events, ensure_ascii=False, indent=2
+    )
+    batch_candidates_json = json.dumps(
+        batch_info.candidates_subset, ensure_ascii=False, indent=2
+    )
+    batch_registry_json = json.dumps(
+        batch_info.registry_subset, ensure_ascii=False, indent=2
+    )
+
+    print(f"{label} [Call 3.2] 必要性 + 颗粒度判断...")
+    necessity = grader.extract(
+        events_json=batch_events_json,
+        candidates_json=batch_candidates_json,
+        events_slim=batch_info.events,
+    )
+    if batch_idx == 0:
+        save_json(necessity, debug_dir / "necessary.json")
+
+    necessary_json = necessity.model_dump_json(indent=2)
+
+    print(f"{label} [Call 3.3] 转移标注...")
+    transitions_draft = annotator.extract(
+        events_json=batch_events_json,
+        necessary_json=necessary_json,
+        registry_json=batch_registry_json,
+        registry=registry,
+        valid_names=valid_names,
+    )
+    draft_dicts = [
+        {
+            "event_id": t.event_id,
+            "preconditions": [
+                p.model_dump(by_alias=True) for p in t.preconditions
+            ],
+            "effects": [
+                e.model_dump(by_alias=True) for e in t.effects
+            ],
+        }
+        for t in transitions_draft.transitions
+    ]
+    if batch_idx == 0:
+        save_json(draft_dicts, debug_dir / "transitions_draft.json")
+
+    print(f"{label} [Call 3.4] 交叉验证...")
+    validation = validator.extract(
+        events_json=batch_events_json,
+        transitions_draft=draft_dicts,
+        events_slim=batch_info.events,
+        registry_json=batch_registry_json,
+        necessary_json=necessary_json,
+    )
+    if batch_idx == 0:
+        save_json(validation, debug_dir / "validation_report.json")
+
+    has_errors = any(r.errors for r in validation.reports)
+    if not has_errors:
+        print(f"{label}   - 验证通过，无需修复")
+        return draft_dicts
+
+    print(f"{label} [Call 3.5] 发现错误，修复中...")
+    error_eids = {r.event_id for r in validation.reports if r.errors}
+    problematic = [e for e in draft_dicts if e["event_id"] in error_eids]
+    error_reports = [
+        r.model_dump() for r in validation.reports if r.errors
+    ]
+
+    repaired = repairer.extract(
+        problematic_events=problematic,
+        validation_reports=error_reports,
+        registry_json=batch_registry_json,
+    )
+    final_dicts = merge_repairs(draft_dicts, repaired)
+    if batch_idx == 0:
+        save_json(final_dicts, debug_dir / "repairs.json")
+
+    remaining_errors = validate_transitions(final_dicts, registry, valid_names)
+    if remaining_errors:
+        print(f"{label}   ⚠ 修复后仍有 {len(remaining_errors)} 个问题")
+        for e in remaining_errors[:3]:
+            print(f"    · {e}")
+    return final_dicts
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("用法: python extract.py <input.txt> [output_dir]")
+        print("用法: python extract.py <input.txt> [output_dir] [stage3_workers]")
         print("示例: python extract.py ../data/novels/凡人修仙传.txt")
         sys.exit(1)
 
     input_file = sys.argv[1]
     output = sys.argv[2] if len(sys.argv) > 2 else None
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else config.STAGE3_MAX_WORKERS
 
     try:
-        main(input_file, output)
+        main(input_file, output, workers)
     except Exception as e:
         print(f"\n[错误] {e}")
         import traceback
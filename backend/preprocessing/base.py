@@ -1,5 +1,6 @@
 import sys
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Type, TypeVar
 
@@ -11,6 +12,13 @@ import config
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _read_prompt(module_name: str, prompt_file: str) -> str:
+    module = sys.modules[module_name]
+    prompts_dir = Path(module.__file__).parent / "prompts"
+    return (prompts_dir / prompt_file).read_text(encoding="utf-8")
+
+
 class BaseExtractor(ABC):
 
     def __init__(self, llm_client: LLMClient):
@@ -53,10 +61,18 @@ class BaseExtractor(ABC):
     def api_key_env(self) -> str | None:
         return self._config.api_key_env
 
+    @cached_property
+    def _llm_params(self) -> dict:
+        return {
+            "temperature": self.temperature,
+            "thinking_budget": self.thinking_budget,
+            "extra_params": self.extra_params or None,
+            "api_base": self.api_base,
+            "api_key_env": self.api_key_env,
+        }
+
     def load_prompt(self) -> str:
-        module = sys.modules[self.__class__.__module__]
-        prompts_dir = Path(module.__file__).parent / "prompts"
-        return (prompts_dir / self.prompt_file).read_text(encoding="utf-8")
+        return _read_prompt(self.__class__.__module__, self.prompt_file)
 
     def extract(self, **kwargs) -> T:
         prompt_template = self.load_prompt()
@@ -68,11 +84,7 @@ class BaseExtractor(ABC):
             prompt=prompt,
             response_model=self.response_model,
             model=self.model_name,
-            temperature=self.temperature,
-            thinking_budget=self.thinking_budget,
-            extra_params=self.extra_params or None,
-            api_base=self.api_base,
-            api_key_env=self.api_key_env,
+            **self._llm_params,
         )
 
         print(f"  [{self.__class__.__name__}] 完成")
@@ -113,11 +125,7 @@ class ValidatedExtractor(BaseExtractor):
                 prompt=prompt,
                 response_model=self.response_model,
                 model=self.model_name,
-                temperature=self.temperature,
-                thinking_budget=self.thinking_budget,
-                extra_params=self.extra_params or None,
-                api_base=self.api_base,
-                api_key_env=self.api_key_env,
+                **self._llm_params,
             )
 
             errors = self.validate(result, **kwargs)
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 import config
 from .token_estimator import TokenEstimator
 
+_REGISTRY_CATEGORIES = ("characters", "locations", "items", "knowledge")
+
 
 @dataclass
 class BatchInfo:
@@ -66,11 +68,13 @@ class BatchManager:
             event_entity_ids.append({c["id"] for c in cand_list})
 
         entity_token_map: dict[str, int] = {}
-        for category in ("characters", "locations", "items", "knowledge"):
-            for entity in registry.get(category, []):
+        entity_positions: dict[str, list[tuple[int, int]]] = {}
+        for cat_idx, category in enumerate(_REGISTRY_CATEGORIES):
+            for pos, entity in enumerate(registry.get(category, [])):
                 entity_token_map[entity["id"]] = self._estimator.count_tokens(
                     json.dumps(entity, ensure_ascii=False)
                 )
+                entity_positions.setdefault(entity["id"], []).append((cat_idx, pos))
 
         fixed_cost = max(self._fixed_costs.values())
         budget = self._effective_budget
@@ -119,11 +123,13 @@ class BatchManager:
             batch_info = BatchInfo(
                 events=batch_events,
                 event_ids=batch_event_ids,
-                registry_subset=self._prune_registry(registry, batch_entity_ids),
+                registry_subset=self._prune_registry(
+                    registry, entity_positions, batch_entity_ids
+                ),
                 candidates_subset={
-                    eid: cands
-                    for eid, cands in candidates.items()
-                    if eid in batch_event_ids
+                    e["id"]: candidates[e["id"]]
+                    for e in batch_events
+                    if e["id"] in candidates
                 },
                 overlap_count=prev_overlap,
             )
@@ -163,15 +169,19 @@ class BatchManager:
         return end
 
     @staticmethod
-    def _prune_registry(registry: dict, entity_ids: set[str]) -> dict:
-        return {
-            category: [
-                entity
-                for entity in registry.get(category, [])
-                if entity["id"] in entity_ids
-            ]
-            for category in ("characters", "locations", "items", "knowledge")
-        }
+    def _prune_registry(
+        registry: dict,
+        entity_positions: dict[str, list[tuple[int, int]]],
+        entity_ids: set[str],
+    ) -> dict:
+        positions = sorted(
+            p for eid in entity_ids for p in entity_positions.get(eid, ())
+        )
+        subset: dict[str, list[dict]] = {c: [] for c in _REGISTRY_CATEGORIES}
+        for cat_idx, pos in positions:
+            category = _REGISTRY_CATEGORIES[cat_idx]
+            subset[category].append(registry[category][pos])
+        return subset
 
     def _compute_overlap(
         self, event_token_costs: list[int], start: int, end: int
@@ -1,3 +1,4 @@
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 
 from core.models import SentenceData
@@ -8,7 +9,9 @@ def scan_entities(
     registry: dict,
     sentences: SentenceData,
 ) -> dict[str, list[dict]]:
-    sentence_map = {s.index: s.text for s in sentences.sentences}
+    ordered = sorted(sentences.sentences, key=lambda s: s.index)
+    sentence_indices = [s.index for s in ordered]
+    sentence_texts = [s.text for s in ordered]
 
     name_index: dict[str, list[dict]] = defaultdict(list)
     type_mapping = {
@@ -38,10 +41,9 @@ def scan_entities(
         if len(sr) != 2:
             continue
 
-        event_text = ""
-        for idx in range(sr[0], sr[1] + 1):
-            if idx in sentence_map:
-                event_text += sentence_map[idx]
+        lo = bisect_left(sentence_indices, sr[0])
+        hi = bisect_right(sentence_indices, sr[1])
+        event_text = "".join(sentence_texts[lo:hi])
 
         matched: dict[str, dict] = {}
         for name, entries in name_index.items():
@@ -1,20 +1,17 @@
-import json
-
 from core.models import EventData, LorebookData
 
 
-def extract_events_for_stage3(events: EventData) -> str:
-    slim = [
+def extract_events_for_stage3(events: EventData) -> list[dict]:
+    return [
         {
             "id": e.id,
             "type": e.type,
             "decision_text": e.decision_text,
             "goal": e.goal,
-            "sentence_range": e.sentence_range,
+            "sentence_range": list(e.sentence_range),
         }
         for e in events.events
     ]
-    return json.dumps(slim, ensure_ascii=False, indent=2)
 
 
 def extract_characters_for_stage3(lorebook: LorebookData) -> list[dict]:
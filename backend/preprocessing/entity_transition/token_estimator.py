@@ -4,6 +4,8 @@ import tiktoken
 
 import config
 
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
+
 
 class TokenEstimator:
 
@@ -21,7 +23,6 @@ class TokenEstimator:
 
 
 def compute_fixed_costs(estimator: TokenEstimator) -> dict[str, int]:
-    prompt_dir = Path(__file__).parent / "prompts"
 
     templates = {
         "necessity_grader": "necessity_grading.txt",
@@ -52,7 +53,7 @@ def compute_fixed_costs(estimator: TokenEstimator) -> dict[str, int]:
 
     costs: dict[str, int] = {}
     for name, filename in templates.items():
-        template_text = (prompt_dir / filename).read_text(encoding="utf-8")
+        template_text = (_PROMPTS_DIR / filename).read_text(encoding="utf-8")
         for ph in placeholders[name]:
             template_text = template_text.replace(ph, "")
         costs[name] = estimator.count_tokens(template_text)
@@ -31,6 +31,7 @@ class TransitionAnnotator(ValidatedExtractor):
 
     def validate(self, result: TransitionData, **kwargs) -> list[str]:
         registry = kwargs.get("_registry", {})
+        valid_names = kwargs.get("_valid_names")
         transitions_dicts = [
             {
                 "event_id": t.event_id,
@@ -43,7 +44,7 @@ class TransitionAnnotator(ValidatedExtractor):
             }
             for t in result.transitions
         ]
-        return validate_transitions(transitions_dicts, registry)
+        return validate_transitions(transitions_dicts, registry, valid_names)
 
     def extract(
         self,
@@ -51,10 +52,12 @@ class TransitionAnnotator(ValidatedExtractor):
         necessary_json: str,
         registry_json: str,
         registry: dict | None = None,
+        valid_names: frozenset[str] | None = None,
     ) -> TransitionData:
         return super().extract(
             events_json=events_json,
             necessary_json=necessary_json,
             registry_json=registry_json,
             _registry=registry or {},
+            _valid_names=valid_names,
         )
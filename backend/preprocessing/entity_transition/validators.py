@@ -33,12 +33,7 @@ def validate_necessity(necessity_data: dict, events_slim: list[dict]) -> list[st
     return errors
 
 
-def validate_transitions(
-    transitions: list[dict],
-    registry: dict,
-) -> list[str]:
-    errors = []
-
+def build_valid_names(registry: dict) -> frozenset[str]:
     valid_names = {"null"}
     for category in ("characters", "locations", "items", "knowledge"):
         for entity in registry.get(category, []):
@@ -46,6 +41,18 @@ def validate_transitions(
             for alias in entity.get("aliases", []):
                 if alias:
                     valid_names.add(alias)
+    return frozenset(valid_names)
+
+
+def validate_transitions(
+    transitions: list[dict],
+    registry: dict,
+    valid_names: frozenset[str] | None = None,
+) -> list[str]:
+    errors = []
+
+    if valid_names is None:
+        valid_names = build_valid_names(registry)
 
     for event in transitions:
         eid = event.get("event_id", "?")
@@ -68,7 +75,7 @@ def validate_transitions(
 
 
 def _validate_entry(
-    entry: dict, eid: str, valid_names: set[str], errors: list[str]
+    entry: dict, eid: str, valid_names: frozenset[str], errors: list[str]
 ) -> None:
     name = entry.get("name", "")
     etype = entry.get("type", "")
@@ -1,3 +1,4 @@
+from bisect import bisect_left, bisect_right
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -5,10 +6,16 @@ from core.llm import LLMClient
 from core.models import EventData, SentenceData
 import config
 
+_PROMPT_PATH = Path(__file__).parent / "prompts" / "decision_text_extraction.txt"
 
-def _get_text(sentences: SentenceData, sentence_range: list[int]) -> str:
+
+def _get_text(
+    sentence_indices: list[int], sentence_texts: list[str], sentence_range: list[int],
+) -> str:
     start, end = sentence_range
-    return "".join(s.text for s in sentences.sentences if start <= s.index <= end)
+    lo = bisect_left(sentence_indices, start)
+    hi = bisect_right(sentence_indices, end)
+    return "".join(sentence_texts[lo:hi])
 
 
 class DecisionTextExtractor:
@@ -19,8 +26,7 @@ class DecisionTextExtractor:
         self._template = self._load_prompt()
 
     def _load_prompt(self) -> str:
-        path = Path(__file__).parent / "prompts" / "decision_text_extraction.txt"
-        return path.read_text(encoding="utf-8")
+        return _PROMPT_PATH.read_text(encoding="utf-8")
 
     def compress(self, original_text: str) -> str:
         n = len(original_text)
@@ -46,15 +52,18 @@ class DecisionTextExtractor:
     def extract_all(
         self, events: EventData, sentences: SentenceData, max_workers: int = 4,
     ) -> None:
+        ordered = sorted(sentences.sentences, key=lambda s: s.index)
+        sentence_indices = [s.index for s in ordered]
+        sentence_texts = [s.text for s in ordered]
         units: list[tuple[str, object, str | None]] = []
         for event in events.events:
             if event.type == "interactive" and event.phases:
                 for phase_name, phase in event.phases.items():
                     if phase.sentence_range:
-                        text = _get_text(sentences, phase.sentence_range)
+                        text = _get_text(sentence_indices, sentence_texts, phase.sentence_range)
                         units.append((text, event, phase_name))
             else:
-                text = _get_text(sentences, event.sentence_range)
+                text = _get_text(sentence_indices, sentence_texts, event.sentence_range)
                 units.append((text, event, None))
 
         print(f"  [DecisionTextExtractor] 并发提取 {len(units)} 个文本单元...")
@@ -1,5 +1,6 @@
 import sys
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Callable, Type, TypeVar
 
@@ -15,6 +16,13 @@ import config
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _read_prompt(module_name: str, prompt_file: str) -> str:
+    module = sys.modules[module_name]
+    prompt_path = Path(module.__file__).parent / prompt_file
+    return prompt_path.read_text(encoding="utf-8")
+
+
 class BaseLLMCaller(ABC):
 
     def __init__(self, llm_client: LLMClient):
@@ -54,10 +62,18 @@ class BaseLLMCaller(ABC):
     def api_key_env(self) -> str | None:
         return self._config.api_key_env
 
+    @cached_property
+    def _llm_params(self) -> dict:
+        return {
+            "temperature": self.temperature,
+            "thinking_budget": self.thinking_budget,
+            "extra_params": self.extra_params or None,
+            "api_base": self.api_base,
+            "api_key_env": self.api_key_env,
+        }
+
     def load_prompt(self) -> str:
-        module = sys.modules[type(self).__module__]
-        prompt_path = Path(module.__file__).parent / self.prompt_file
-        return prompt_path.read_text(encoding="utf-8")
+        return _read_prompt(type(self).__module__, self.prompt_file)
 
     def build_prompt(self, template: str, **kwargs) -> str:
         return template
@@ -67,22 +83,14 @@ class BaseLLMCaller(ABC):
             prompt=prompt,
             response_model=self.response_model,
             model=model_override or self.model_name,
-            temperature=self.temperature,
-            thinking_budget=self.thinking_budget,
-            extra_params=self.extra_params or None,
-            api_base=self.api_base,
-            api_key_env=self.api_key_env,
+            **self._llm_params,
         )
 
     def call_llm_text(self, prompt: str, *, model_override: str | None = None, _log: bool = True) -> str:
         return self.llm.generate(
             prompt=prompt,
             model=model_override or self.model_name,
-            temperature=self.temperature,
-            thinking_budget=self.thinking_budget,
-            extra_params=self.extra_params or None,
-            api_base=self.api_base,
-            api_key_env=self.api_key_env,
+            **self._llm_params,
             log=_log,
         )
 
@@ -93,24 +101,18 @@ class BaseLLMCaller(ABC):
         *,
         model_override: str | None = None,
     ) -> str:
-        has_sent = False
+        parts: list[str] = []
         try:
-            full_text = ""
             for chunk in self.llm.generate_stream(
                 prompt=prompt,
                 model=model_override or self.model_name,
-                temperature=self.temperature,
-                thinking_budget=self.thinking_budget,
-                extra_params=self.extra_params or None,
-                api_base=self.api_base,
-                api_key_env=self.api_key_env,
+                **self._llm_params,
             ):
-                full_text += chunk
-                has_sent = True
+                parts.append(chunk)
                 on_chunk(chunk)
-            return full_text
+            return "".join(parts)
         except Exception:
-            if has_sent:
+            if parts:
                 raise
             text = self.call_llm_text(prompt, model_override=model_override, _log=False)
             on_chunk(text)
@@ -123,6 +125,8 @@ class BaseLLMCaller(ABC):
         output_text: str,
         prompt: str | None = None,
     ) -> None:
+        if not glog.enabled("WRITER"):
+            return
         log_data = {
             "writer_type": writer_type,
             "model": self.model_name,
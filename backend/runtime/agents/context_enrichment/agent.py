@@ -11,6 +11,8 @@ from runtime.game_logger import glog
 
 class ContextEnrichmentAgent(BaseAgent):
 
+    RECOGNITION_CACHE_SIZE = 128
+
     def __init__(
         self,
         history_agent: HistoryRecaller,
@@ -22,6 +24,8 @@ class ContextEnrichmentAgent(BaseAgent):
         self._entity = entity_agent
         self._lorebook = lorebook_query
         self._lorebook_content = lorebook_content
+        self._recognized: dict[str, tuple[str, ...]] = {}
+        self._entity_blocks: dict[str, str] = {}
 
     def recall_history(
         self,
@@ -70,36 +74,55 @@ class ContextEnrichmentAgent(BaseAgent):
                 content="<entities><error>Missing text parameter</error></entities>",
             )
 
-        recognition = self._entity.run(
-            text=text,
-            lorebook_content=self._lorebook_content,
-        )
+        entity_ids = self._recognize(text)
 
         glog.log("TOOL_CALL", {
             "agent": "context_enrichment",
             "tool": "query_entities",
             "text": text,
-            "entity_ids": recognition.entity_ids,
+            "entity_ids": list(entity_ids),
         })
 
-        if not recognition.entity_ids:
+        if not entity_ids:
             return ToolResult(
                 tool_name="query_entities",
                 content="<entities><empty>No entities recognized</empty></entities>",
             )
 
-        entities = self._lorebook.get_many(recognition.entity_ids)
+        blocks = [self._entity_block(e) for e in self._lorebook.get_many(entity_ids)]
         return ToolResult(
             tool_name="query_entities",
-            content=_format_entities(entities),
+            content="\n".join(["<entities>", *blocks, "</entities>"]),
         )
 
-
-def _format_entities(entities: list[dict[str, Any]]) -> str:
-    parts = ["<entities>"]
-    for e in entities:
-        parts.append(f'<entity id="{e["id"]}" type="{e["type"]}">')
-        parts.append(json.dumps(e["data"], ensure_ascii=False, indent=2))
-        parts.append("</entity>")
-    parts.append("</entities>")
-    return "\n".join(parts)
+    def _entity_block(self, entity: dict[str, Any]) -> str:
+        block = self._entity_blocks.get(entity["id"])
+        if block is None:
+            block = _format_entity(entity)
+            self._entity_blocks[entity["id"]] = block
+        return block
+
+    def reset_recognition_cache(self) -> None:
+        """Drop memoized recognitions; called by GameEngine on new_game/load_game."""
+        self._recognized.clear()
+
+    def _recognize(self, text: str) -> tuple[str, ...]:
+        entity_ids = self._recognized.get(text)
+        if entity_ids is None:
+            recognition = self._entity.run(
+                text=text,
+                lorebook_content=self._lorebook_content,
+            )
+            entity_ids = tuple(recognition.entity_ids)
+            if len(self._recognized) >= self.RECOGNITION_CACHE_SIZE:
+                del self._recognized[next(iter(self._recognized))]
+            self._recognized[text] = entity_ids
+        return entity_ids
+
+
+def _format_entity(entity: dict[str, Any]) -> str:
+    return "\n".join([
+        f'<entity id="{entity["id"]}" type="{entity["type"]}">',
+        json.dumps(entity["data"], ensure_ascii=False, indent=2),
+        "</entity>",
+    ])
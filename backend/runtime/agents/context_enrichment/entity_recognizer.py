@@ -24,12 +24,8 @@ class EntityRecognizerAgent(BaseLLMCaller):
             response_model=self.response_model,
             cached_content=lorebook_content,
             model=self.model_name,
-            temperature=self.temperature,
             cache_ttl=config.LOREBOOK_CACHE_TTL,
-            thinking_budget=self.thinking_budget,
-            extra_params=self.extra_params or None,
-            api_base=self.api_base,
-            api_key_env=self.api_key_env,
+            **self._llm_params,
         )
         return result
 
@@ -53,12 +53,8 @@ class DeltaStateManager:
             1 for d in self.delta_entries
             if d.status in (DeltaStatus.ACTIVE, DeltaStatus.ECHOING)
         )
-        while active_count >= self.MAX_ACTIVE:
+        for _ in range(active_count - self.MAX_ACTIVE + 1):
             self._evict_lru()
-            active_count = sum(
-                1 for d in self.delta_entries
-                if d.status in (DeltaStatus.ACTIVE, DeltaStatus.ECHOING)
-            )
 
         delta_id = f"delta-{self._next_id:03d}"
         self._next_id += 1
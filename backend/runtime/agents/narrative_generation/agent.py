@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import threading
 
@@ -41,6 +42,9 @@ class NarrativeGenerationAgent(BaseAgent):
     def __init__(self, llm: LLMClient, writer: object):
         self._llm = llm
         self._writer = writer
+        self._tool_pool = ThreadPoolExecutor(
+            max_workers=len(self._TOOL_HANDLERS), thread_name_prefix="toolloop",
+        )
 
         self._phase_prompts: dict[PhaseType, tuple[str, str]] = {}
         self._loop_configs: dict[PhaseType, LoopConfig] = {}
@@ -99,7 +103,7 @@ class NarrativeGenerationAgent(BaseAgent):
 
         loop_result = run_tool_loop(
             self._llm, system_prompt, user_input,
-            self._loop_configs[phase], tool_handler,
+            self._loop_configs[phase], tool_handler, self._tool_pool,
         )
 
         deviation_analysis = captured.get("deviation_analysis")
@@ -195,63 +199,73 @@ class NarrativeGenerationAgent(BaseAgent):
         captured: dict,
         captured_lock: threading.Lock,
     ) -> ToolResult:
-        if tool_call.name == "recall_history":
-            return self._agent_executor.get("context_enrichment").recall_history(
-                state,
-                tool_call.arguments.get("query", ""),
-                context.event_meta.event_id,
+        handler = self._TOOL_HANDLERS.get(tool_call.name)
+        if handler is None:
+            return ToolResult(
+                tool_name=tool_call.name,
+                content=f"<error>Unknown tool: {tool_call.name}</error>",
             )
+        return handler(self, tool_call, context, state, captured, captured_lock)
 
-        if tool_call.name == "query_entities":
-            raw_text = tool_call.arguments.get("text", "")
-            text = " ".join(raw_text) if isinstance(raw_text, list) else str(raw_text)
-            return self._agent_executor.get("context_enrichment").query_entities(text)
-
-        if tool_call.name == "check_deviation":
-            if not context.player_input:
-                return ToolResult(
-                    tool_name="check_deviation",
-                    content="玩家输入为空，该调用已被拦截。",
-                )
-            result = self._agent_executor.get("deviation_guidance").check_deviation(
-                state, context.event_context, tool_call.arguments,
-            )
-            with captured_lock:
-                captured["deviation_analysis"] = result.analysis
-            if result.analysis and result.analysis.release:
-                return ToolResult(tool_name="deviation_release", content=result.tool_result.content)
-            return result.tool_result
+    def _handle_recall_history(
+        self,
+        tool_call: ToolCall,
+        context: AgentContext,
+        state: GameState,
+        captured: dict,
+        captured_lock: threading.Lock,
+    ) -> ToolResult:
+        return self._agent_executor.get("context_enrichment").recall_history(
+            state,
+            tool_call.arguments.get("query", ""),
+            context.event_meta.event_id,
+        )
 
-        if tool_call.name == "request_bridge":
-            with captured_lock:
-                captured["bridge_conflicts"] = tool_call.arguments.get("conflicts", [])
-            return ToolResult(tool_name="request_bridge", content="<bridge_requested/>")
+    def _handle_query_entities(
+        self,
+        tool_call: ToolCall,
+        context: AgentContext,
+        state: GameState,
+        captured: dict,
+        captured_lock: threading.Lock,
+    ) -> ToolResult:
+        raw_text = tool_call.arguments.get("text", "")
+        text = " ".join(raw_text) if isinstance(raw_text, list) else str(raw_text)
+        return self._agent_executor.get("context_enrichment").query_entities(text)
 
-        if tool_call.name == "request_adaptation":
-            return self._handle_adaptation(
-                tool_call, context, state, captured, captured_lock,
+    def _handle_check_deviation(
+        self,
+        tool_call: ToolCall,
+        context: AgentContext,
+        state: GameState,
+        captured: dict,
+        captured_lock: threading.Lock,
+    ) -> ToolResult:
+        if not context.player_input:
+            return ToolResult(
+                tool_name="check_deviation",
+                content="玩家输入为空，该调用已被拦截。",
             )
-
-        return ToolResult(
-            tool_name=tool_call.name,
-            content=f"<error>Unknown tool: {tool_call.name}</error>",
+        result = self._agent_executor.get("deviation_guidance").check_deviation(
+            state, context.event_context, tool_call.arguments,
         )
+        with captured_lock:
+            captured["deviation_analysis"] = result.analysis
+        if result.analysis and result.analysis.release:
+            return ToolResult(tool_name="deviation_release", content=result.tool_result.content)
+        return result.tool_result
 
-    def _log_generation(self, context, tool_results, narrative: str, awaiting_input: bool, phase_complete: bool) -> None:
-        glog.log("AGENT_EXEC", {
-            "agent": "narrative_generation",
-            "action": "generation_complete",
-            "phase": context.phase.value,
-            "player_input": context.player_input,
-            "tools_called": list(tool_results.keys()),
-            "tool_results": {
-                k: v.content if hasattr(v, "content") else str(v)
-                for k, v in tool_results.items()
-            },
-            "narrative": narrative,
-            "awaiting_input": awaiting_input,
-            "phase_complete": phase_complete,
-        })
+    def _handle_request_bridge(
+        self,
+        tool_call: ToolCall,
+        context: AgentContext,
+        state: GameState,
+        captured: dict,
+        captured_lock: threading.Lock,
+    ) -> ToolResult:
+        with captured_lock:
+            captured["bridge_conflicts"] = tool_call.arguments.get("conflicts", [])
+        return ToolResult(tool_name="request_bridge", content="<bridge_requested/>")
 
     def _handle_adaptation(
         self,
@@ -310,6 +324,35 @@ class NarrativeGenerationAgent(BaseAgent):
             content="<adaptation_result>无适配指令</adaptation_result>",
         )
 
+    _TOOL_HANDLERS = {
+        "recall_history": _handle_recall_history,
+        "query_entities": _handle_query_entities,
+        "check_deviation": _handle_check_deviation,
+        "request_bridge": _handle_request_bridge,
+        "request_adaptation": _handle_adaptation,
+    }
+
+    def shutdown(self) -> None:
+        self._tool_pool.shutdown(wait=True)
+
+    def _log_generation(self, context, tool_results, narrative: str, awaiting_input: bool, phase_complete: bool) -> None:
+        if not glog.enabled("AGENT_EXEC"):
+            return
+        glog.log("AGENT_EXEC", {
+            "agent": "narrative_generation",
+            "action": "generation_complete",
+            "phase": context.phase.value,
+            "player_input": context.player_input,
+            "tools_called": list(tool_results.keys()),
+            "tool_results": {
+                k: v.content if hasattr(v, "content") else str(v)
+                for k, v in tool_results.items()
+            },
+            "narrative": narrative,
+            "awaiting_input": awaiting_input,
+            "phase_complete": phase_complete,
+        })
+
     def _log_error(self, context, tool_results, writer_input, error) -> None:
         glog.log("ERROR", {
             "agent": "narrative_generation",
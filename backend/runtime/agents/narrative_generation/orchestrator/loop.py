@@ -1,5 +1,5 @@
 import json
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from typing import Callable
 
@@ -15,7 +15,7 @@ from runtime.agents.models import (
 from runtime.game_logger import glog
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopConfig:
     model: str
     temperature: float
@@ -27,7 +27,7 @@ class LoopConfig:
     api_key_env: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopResult:
     tool_results: dict[str, ToolResult] = field(default_factory=dict)
     orchestrator_meta: dict = field(default_factory=dict)
@@ -39,6 +39,7 @@ def run_tool_loop(
     user_input: str,
     loop_config: LoopConfig,
     tool_handler: Callable[[ToolCall], ToolResult],
+    tool_pool: Executor,
 ) -> LoopResult:
     messages = [
         {"role": "system", "content": system_prompt},
@@ -50,22 +51,23 @@ def run_tool_loop(
         response_text = _call_llm(llm, messages, loop_config)
         parsed = _parse_response(response_text)
 
-        if isinstance(parsed, ToolCallsOutput):
-            glog.log("AGENT_EXEC", {
-                "agent": loop_config.config_name,
-                "step": "tool_loop_round",
-                "round": round_num + 1,
-                "tool_calls": [tc.name for tc in parsed.tool_calls],
-            })
-        else:
-            glog.log("AGENT_EXEC", {
-                "agent": loop_config.config_name,
-                "step": "ready_for_writer",
-                "round": round_num + 1,
-            })
+        if glog.enabled("AGENT_EXEC"):
+            if isinstance(parsed, ToolCallsOutput):
+                glog.log("AGENT_EXEC", {
+                    "agent": loop_config.config_name,
+                    "step": "tool_loop_round",
+                    "round": round_num + 1,
+                    "tool_calls": [tc.name for tc in parsed.tool_calls],
+                })
+            else:
+                glog.log("AGENT_EXEC", {
+                    "agent": loop_config.config_name,
+                    "step": "ready_for_writer",
+                    "round": round_num + 1,
+                })
 
         if isinstance(parsed, ToolCallsOutput) and parsed.tool_calls:
-            results = _execute_tool_calls_parallel(parsed.tool_calls, tool_handler)
+            results = _execute_tool_calls_parallel(parsed.tool_calls, tool_handler, tool_pool)
             for r in results:
                 all_tool_results[r.tool_name] = r
             if "request_bridge" in all_tool_results or "deviation_release" in all_tool_results:
@@ -171,13 +173,10 @@ def _append_tool_results(
 def _execute_tool_calls_parallel(
     tool_calls: list[ToolCall],
     tool_handler: Callable[[ToolCall], ToolResult],
+    tool_pool: Executor,
 ) -> list[ToolResult]:
     if len(tool_calls) <= 1:
         return [tool_handler(tc) for tc in tool_calls]
 
-    with ThreadPoolExecutor(
-        max_workers=len(tool_calls),
-        thread_name_prefix="toolloop",
-    ) as pool:
-        futures = [pool.submit(tool_handler, tc) for tc in tool_calls]
-        return [f.result() for f in futures]
+    futures = [tool_pool.submit(tool_handler, tc) for tc in tool_calls]
+    return [f.result() for f in futures]
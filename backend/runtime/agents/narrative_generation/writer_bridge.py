@@ -1,6 +1,10 @@
+import re
+
 from runtime.agents.base import AgentContext
 from runtime.agents.delta_lifecycle.agent import DeltaContextResult
 
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 
 def build_orchestrator_input(
     template: str,
@@ -8,24 +12,24 @@ def build_orchestrator_input(
     delta_ctx: DeltaContextResult,
     history_text: str = "",
 ) -> str:
-    return (
-        template
-        .replace("{phase_source}", context.phase_source_decision)
-        .replace("{setup_narrative}", context.event_context.setup_narrative or "")
-        .replace("{confrontation_history}", history_text)
-        .replace("{active_deltas}", delta_ctx.active_tags)
-        .replace("{already_activated}", delta_ctx.already_activated)
-        .replace("{pending_echo}", delta_ctx.pending_echo_tags)
-        .replace("{archived_overrides}", delta_ctx.archived_text)
-        .replace("{previous_event}", context.previous_event or "")
-        .replace("{player_input}", context.player_input or "[无玩家输入——开篇叙事阶段，禁止调用 check_deviation]")
-        .replace("{event_id}", context.event_meta.event_id)
-        .replace("{importance}", context.event_meta.importance)
-        .replace("{goal}", context.event_meta.goal or "")
-        .replace("{soft_guide_hints}", "\n".join(f"- {h}" for h in context.event_meta.soft_guide_hints) or "无")
-        .replace("{event_type}", context.event_meta.event_type)
-        .replace("{preconditions}", _format_preconditions(context.event_meta.preconditions))
-    )
+    values = {
+        "phase_source": context.phase_source_decision,
+        "setup_narrative": context.event_context.setup_narrative or "",
+        "confrontation_history": history_text,
+        "active_deltas": delta_ctx.active_tags,
+        "already_activated": delta_ctx.already_activated,
+        "pending_echo": delta_ctx.pending_echo_tags,
+        "archived_overrides": delta_ctx.archived_text,
+        "previous_event": context.previous_event or "",
+        "player_input": context.player_input or "[无玩家输入——开篇叙事阶段，禁止调用 check_deviation]",
+        "event_id": context.event_meta.event_id,
+        "importance": context.event_meta.importance,
+        "goal": context.event_meta.goal or "",
+        "soft_guide_hints": "\n".join(f"- {h}" for h in context.event_meta.soft_guide_hints) or "无",
+        "event_type": context.event_meta.event_type,
+        "preconditions": _format_preconditions(context.event_meta.preconditions),
+    }
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m[1], m[0]), template)
 
 
 def _format_preconditions(preconditions: list[dict]) -> str:
@@ -1,11 +1,16 @@
 import json
+import os
 import queue
+import re
+import shutil
 import threading
 from concurrent.futures import ThreadPoolExecutor, Future
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from core.llm import LLMClient
 from core.models import Event, PhaseType
 from runtime.world import WorldPkgLoader
@@ -35,12 +40,13 @@ from runtime.agents.narrative_generation import (
     NarrativeGenerationAgent,
     NarrativeGenerationResult,
 )
+from runtime.agents.narrative_generation.agent import _render_adaptation_plan_tags
 from runtime.agents.scene_adaptation import SceneAdaptationAgent
 import config
 from runtime.game_logger import glog
 
 
-@dataclass
+@dataclass(slots=True)
 class _PrefetchSlot:
     action: str                                                  
     future: Future | None = None
@@ -55,7 +61,7 @@ class _PrefetchSlot:
     bridge_data: BridgeResult | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResponseState:
     phase: str | None
     event_id: str | None
@@ -64,6 +70,9 @@ class ResponseState:
     game_ended: bool = False
 
 
+_SAVE_DIR_RE = re.compile(r"save_(\d+)")
+_SAVE_COMMAND_RE = re.compile(r"/save(?:\s+(\d+)(?:\s.*)?)?")
+
 _REQUIRED_SAVE_KEYS = {
     "current_event_id", "current_phase", "total_turns",
     "player_name", "awaiting_next_event", "event_context",
@@ -102,8 +111,7 @@ class GameEngine:
             protagonist_aliases=protagonist_aliases,
         )
 
-        lorebook_dir = worldpkg_path / "lorebook"
-        lorebook_query = LorebookQuery(lorebook_dir)
+        lorebook_query = LorebookQuery(world=self.world)
         lorebook_content = lorebook_query.to_lorebook_content()
 
         self.current_event_id: str | None = None
@@ -120,6 +128,8 @@ class GameEngine:
         self.game_ended: bool = False
         self._last_maintained_event_id: str | None = None
         self.on_narrative_chunk = None
+        self._save_metadata_cache: dict[Path, tuple[int, int, dict]] = {}
+        self._event_meta_cache: dict[str, EventMeta] = {}
 
         self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
         self._prefetch_slot: _PrefetchSlot | None = None
@@ -175,6 +185,7 @@ class GameEngine:
             self.l0_summaries = []
             self.l1_summaries = []
             self.agents.get("memory_compression").l1_counter = 0
+            self.agents.get("context_enrichment").reset_recognition_cache()
             self.previous_event_content = None
 
             self.delta_state = DeltaStateManager()
@@ -240,9 +251,10 @@ class GameEngine:
                 return f"[错误] 存档 {slot} 数据损坏：{error}"
 
             self._invalidate_prefetch()
+            self.agents.get("context_enrichment").reset_recognition_cache()
             try:
                 self._restore_save_state(data)
-            except Exception as e:
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
                 return f"[错误] 存档 {slot} 恢复失败：{e}"
 
             self._try_auto_save("load_game")
@@ -315,18 +327,11 @@ class GameEngine:
             if not current_event:
                 return "[错误] 当前事件不存在"
 
-            ctx = self._build_agent_context(current_event, PhaseType.CONFRONTATION, player_input)
-            state = self._build_game_state()
-
-            extra_kwargs: dict = {}
+            ctx, state, extra_kwargs = self._prepare_generation(
+                current_event, PhaseType.CONFRONTATION, player_input,
+            )
             if self.on_narrative_chunk:
                 extra_kwargs["on_chunk"] = self.on_narrative_chunk
-            if self._current_adaptation_plan:
-                from runtime.agents.narrative_generation.agent import _render_adaptation_plan_tags
-                extra_kwargs["adaptation_plan_text"] = _render_adaptation_plan_tags(
-                    self._current_adaptation_plan,
-                )
-                extra_kwargs["adaptation_plan_raw"] = self._current_adaptation_plan
 
             try:
                 result: NarrativeGenerationResult = self.agents.execute(
@@ -372,9 +377,8 @@ class GameEngine:
         state = self._build_game_state()
         extra_kwargs: dict = {}
         if phase == PhaseType.SETUP:
-            extra_kwargs["event_original_text"] = self._get_phase_text_decision(event.id, phase)
+            extra_kwargs["event_original_text"] = self._get_phase_text_decision(event, phase)
         elif self._current_adaptation_plan:
-            from runtime.agents.narrative_generation.agent import _render_adaptation_plan_tags
             extra_kwargs["adaptation_plan_text"] = _render_adaptation_plan_tags(
                 self._current_adaptation_plan,
             )
@@ -484,25 +488,29 @@ class GameEngine:
         event_context: EventContext | None = None,
     ) -> AgentContext:
         return AgentContext(
-            event_meta=EventMeta(
-                event_id=event.id,
-                importance=event.importance.value if hasattr(event.importance, 'value') else str(event.importance),
-                goal=event.goal,
-                event_type=event.type,
-                soft_guide_hints=event.soft_guide_hints,
-                preconditions=[
-                    p.model_dump(by_alias=True)
-                    for p in self.world.get_preconditions(event.id)
-                ],
-            ),
+            event_meta=self._event_meta(event),
             event_context=event_context if event_context is not None else self.event_context,
             phase=phase,
-            phase_source=self._get_phase_text_full(event.id, phase),
-            phase_source_decision=self._get_phase_text_decision(event.id, phase),
+            phase_source=self._get_phase_text_full(event, phase),
+            phase_source_decision=self._get_phase_text_decision(event, phase),
             player_input=player_input,
             previous_event=self.previous_event_content,
         )
 
+    def _event_meta(self, event: Event) -> EventMeta:
+        meta = self._event_meta_cache.get(event.id)
+        if meta is None:
+            meta = EventMeta(
+                event_id=event.id,
+                importance=event.importance.value if hasattr(event.importance, 'value') else str(event.importance),
+                goal=event.goal,
+                event_type=event.type,
+                soft_guide_hints=event.soft_guide_hints,
+                preconditions=self.world.get_precondition_dicts(event.id),
+            )
+            self._event_meta_cache[event.id] = meta
+        return meta
+
     def _update_event_context_after_response(
         self,
         result: NarrativeGenerationResult,
@@ -527,7 +535,7 @@ class GameEngine:
         self.event_context.deviation_history.append(
             HistoryEntry(
                 player_input=player_input,
-                response_summary=json.dumps(analysis.model_dump(), ensure_ascii=False),
+                response_summary=analysis.model_dump_json(),
             )
         )
 
@@ -729,7 +737,7 @@ class GameEngine:
                         current_event_id=next_id,
                     )
                     extra_kwargs: dict = {
-                        "event_original_text": self._get_phase_text_decision(next_id, PhaseType.SETUP),
+                        "event_original_text": self._get_phase_text_decision(next_event, PhaseType.SETUP),
                     }
                     extra_kwargs["on_chunk"] = lambda chunk: slot.chunk_queue.put(chunk)
 
@@ -888,10 +896,11 @@ class GameEngine:
         )
 
     def _save_current_event_as_previous(self) -> None:
-        if self.current_event_id and any(
-            s.event_id == self.current_event_id for s in self.l0_summaries
-        ):
-            existing = next(s for s in self.l0_summaries if s.event_id == self.current_event_id)
+        existing = next(
+            (s for s in self.l0_summaries if s.event_id == self.current_event_id),
+            None,
+        ) if self.current_event_id else None
+        if existing is not None:
             self.previous_event_content = existing.summary
             return
 
@@ -922,19 +931,16 @@ class GameEngine:
             current_event_id=self.current_event_id or "",
         )
 
-    def _get_phase_text(self, event_id: str, phase_type: PhaseType, *, full: bool) -> str:
-        event = self.world.get_event(event_id)
-        if not event:
-            raise ValueError(f"Event {event_id} not found")
+    def _get_phase_text(self, event: Event, phase_type: PhaseType, *, full: bool) -> str:
         if event.type == "narrative":
-            return self.world.get_event_text_full(event_id) if full else self.world.get_event_text_decision(event_id)
-        return self.world.get_phase_text_full(event_id, phase_type.value) if full else self.world.get_phase_text_decision(event_id, phase_type.value)
+            return self.world.get_event_text_full(event.id) if full else self.world.get_event_text_decision(event.id)
+        return self.world.get_phase_text_full(event.id, phase_type.value) if full else self.world.get_phase_text_decision(event.id, phase_type.value)
 
-    def _get_phase_text_full(self, event_id: str, phase_type: PhaseType) -> str:
-        return self._get_phase_text(event_id, phase_type, full=True)
+    def _get_phase_text_full(self, event: Event, phase_type: PhaseType) -> str:
+        return self._get_phase_text(event, phase_type, full=True)
 
-    def _get_phase_text_decision(self, event_id: str, phase_type: PhaseType) -> str:
-        return self._get_phase_text(event_id, phase_type, full=False)
+    def _get_phase_text_decision(self, event: Event, phase_type: PhaseType) -> str:
+        return self._get_phase_text(event, phase_type, full=False)
 
     def _complete_current_event(self) -> str:
         if self.current_event_id is None:
@@ -965,9 +971,9 @@ class GameEngine:
             "total_turns": self.total_turns,
             "player_name": self.player_name,
             "awaiting_next_event": self.awaiting_next_event,
-            "event_context": self.event_context.model_dump(),
-            "l0_summaries": [s.model_dump() for s in l0_snapshot],
-            "l1_summaries": [s.model_dump() for s in l1_snapshot],
+            "event_context": self.event_context,
+            "l0_summaries": l0_snapshot,
+            "l1_summaries": l1_snapshot,
             "_l1_counter": self.agents.get("memory_compression").get_save_state()["l1_counter"],
             "previous_event_content": self.previous_event_content,
             "delta_state": self.delta_state.to_dict(),
@@ -1003,10 +1009,7 @@ class GameEngine:
         save_dir.mkdir(parents=True, exist_ok=True)
 
         state_data = self._collect_save_state()
-        (save_dir / "state.json").write_text(
-            json.dumps(state_data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        (save_dir / "state.json").write_bytes(to_json(state_data, indent=2))
 
         metadata = {
             "save_time": datetime.now().isoformat(),
@@ -1026,17 +1029,31 @@ class GameEngine:
         saves = []
         if not config.SAVES_DIR.exists():
             return saves
-        for save_dir in sorted(config.SAVES_DIR.iterdir()):
-            if save_dir.is_dir() and save_dir.name.startswith("save_"):
-                metadata_path = save_dir / "metadata.json"
-                if metadata_path.exists():
-                    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
-                    slot = int(save_dir.name.split("_")[1])
-                    saves.append({"slot": slot, **metadata})
+        with os.scandir(config.SAVES_DIR) as it:
+            save_dirs = sorted(
+                (entry.name, match)
+                for entry in it
+                if (match := _SAVE_DIR_RE.fullmatch(entry.name)) and entry.is_dir()
+            )
+        for name, match in save_dirs:
+            metadata = self._read_save_metadata(config.SAVES_DIR / name / "metadata.json")
+            if metadata is not None:
+                saves.append({"slot": int(match.group(1)), **metadata})
         return saves
 
+    def _read_save_metadata(self, metadata_path: Path) -> dict | None:
+        try:
+            stat = metadata_path.stat()
+        except FileNotFoundError:
+            return None
+        cached = self._save_metadata_cache.get(metadata_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        self._save_metadata_cache[metadata_path] = (stat.st_mtime_ns, stat.st_size, metadata)
+        return metadata
+
     def _clear_auto_save(self) -> None:
-        import shutil
         save_dir = config.SAVES_DIR / "save_000"
         if save_dir.exists():
             shutil.rmtree(save_dir)
@@ -1044,6 +1061,7 @@ class GameEngine:
     def shutdown(self) -> None:
         self._invalidate_prefetch()
         self._prefetch_pool.shutdown(wait=False)
+        self.agents.get("narrative_generation").shutdown()
         self.agents.get("memory_compression").shutdown()
         glog.log("GAME_STATE", {
             "action": "shutdown",
@@ -1065,9 +1083,8 @@ class GameEngine:
                 "/quit - 退出游戏"
             )
 
-        if cmd.startswith("/save") and not cmd.startswith("/saves"):
-            parts = cmd.split()
-            slot = int(parts[1]) if len(parts) > 1 else 1
+        if match := _SAVE_COMMAND_RE.fullmatch(cmd):
+            slot = int(match.group(1)) if match.group(1) else 1
             return self.save_game(slot)
 
         if cmd == "/saves":
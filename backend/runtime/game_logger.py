@@ -40,12 +40,14 @@ class GameLogger:
             self._file.close()
             self._file = None
 
-    def log(self, category: str, data: dict) -> None:
+    def enabled(self, category: str) -> bool:
         if not config.SESSION_LOG_ENABLED or not self._file:
-            return
-
+            return False
         cats = config.SESSION_LOG_CATEGORIES
-        if cats != "ALL" and category not in cats:
+        return cats == "ALL" or category in cats
+
+    def log(self, category: str, data: dict) -> None:
+        if not self.enabled(category):
             return
 
         entry = {
@@ -3,59 +3,72 @@ from pathlib import Path
 from typing import Any
 
 import config
+from runtime.world.loader import WorldPkgLoader
+
+_LOREBOOK_FILES = (
+    ("characters.json", "characters", "character"),
+    ("locations.json", "locations", "location"),
+    ("items.json", "items", "item"),
+)
 
 
 class LorebookQuery:
 
-    def __init__(self, lorebook_dir: Path | None = None):
-        self.lorebook_dir = lorebook_dir or (config.OUTPUT_BASE / "lorebook")
+    def __init__(
+        self,
+        lorebook_dir: Path | None = None,
+        world: WorldPkgLoader | None = None,
+    ):
         self._index: dict[str, dict[str, Any]] = {}
-        self._load()
+        if world is not None:
+            self.lorebook_dir = world.path / "lorebook"
+            self._load_from_world(world)
+        else:
+            self.lorebook_dir = lorebook_dir or (config.OUTPUT_BASE / "lorebook")
+            self._load()
+        self._ids = tuple(self._index)
+
+    def _add(self, entity_id: str, entity_type: str, data: dict[str, Any]) -> None:
+        self._index[entity_id] = {"id": entity_id, "type": entity_type, "data": data}
+
+    def _load_from_world(self, world: WorldPkgLoader) -> None:
+        for char in world.characters.characters:
+            self._add(char.id, "character", char.model_dump(mode="json"))
+        for loc in world.locations.locations:
+            self._add(loc.id, "location", loc.model_dump(mode="json"))
+        for item in world.items.items:
+            self._add(item.id, "item", item.model_dump(mode="json"))
 
     def _load(self) -> None:
-        characters_file = self.lorebook_dir / "characters.json"
-        if characters_file.exists():
-            data = json.loads(characters_file.read_text(encoding="utf-8"))
-            for char in data.get("characters", []):
-                self._index[char["id"]] = {"type": "character", "data": char}
-
-        locations_file = self.lorebook_dir / "locations.json"
-        if locations_file.exists():
-            data = json.loads(locations_file.read_text(encoding="utf-8"))
-            for loc in data.get("locations", []):
-                self._index[loc["id"]] = {"type": "location", "data": loc}
-
-        items_file = self.lorebook_dir / "items.json"
-        if items_file.exists():
-            data = json.loads(items_file.read_text(encoding="utf-8"))
-            for item in data.get("items", []):
-                self._index[item["id"]] = {"type": "item", "data": item}
+        for filename, key, entity_type in _LOREBOOK_FILES:
+            path = self.lorebook_dir / filename
+            if not path.exists():
+                continue
+            data = json.loads(path.read_bytes())
+            for entity in data.get(key, []):
+                self._add(entity["id"], entity_type, entity)
 
     def get(self, entity_id: str) -> dict[str, Any] | None:
-        entry = self._index.get(entity_id)
-        if entry is None:
-            return None
-        return {"id": entity_id, "type": entry["type"], "data": entry["data"]}
+        return self._index.get(entity_id)
 
     def get_many(self, entity_ids: list[str]) -> list[dict[str, Any]]:
-        results = []
-        for eid in entity_ids:
-            entity = self.get(eid)
-            if entity is not None:
-                results.append(entity)
-        return results
+        index = self._index
+        return [entry for eid in entity_ids if (entry := index.get(eid)) is not None]
 
     def exists(self, entity_id: str) -> bool:
         return entity_id in self._index
 
-    def all_ids(self) -> list[str]:
-        return list(self._index.keys())
+    def all_ids(self) -> tuple[str, ...]:
+        return self._ids
 
     def to_lorebook_content(self) -> str:
+        grouped: dict[str, list[dict[str, Any]]] = {
+            entity_type: [] for _, _, entity_type in _LOREBOOK_FILES
+        }
+        for entry in self._index.values():
+            grouped[entry["type"]].append(entry["data"])
         lorebook_data = {
-            "characters": {"characters": [e["data"] for e in self._index.values() if e["type"] == "character"]},
-            "locations": {"locations": [e["data"] for e in self._index.values() if e["type"] == "location"]},
-            "items": {"items": [e["data"] for e in self._index.values() if e["type"] == "item"]},
+            key: {key: grouped[entity_type]} for _, key, entity_type in _LOREBOOK_FILES
         }
         return json.dumps(lorebook_data, ensure_ascii=False)
 
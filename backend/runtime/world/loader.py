@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from typing import TypeVar
 
@@ -18,6 +17,7 @@ from core.models import (
     CharacterImportance,
     KnowledgeData,
     EventTransition,
+    TransitionData,
     Precondition,
 )
 
@@ -33,7 +33,7 @@ class WorldPkgLoader:
 
     def _load(self, model: type[T], rel_path: str) -> T:
         path = self.path / rel_path
-        return model.model_validate_json(path.read_text(encoding="utf-8"))
+        return model.model_validate_json(path.read_bytes())
 
     def _load_all(self) -> None:
         self.metadata = self._load(Metadata, "metadata.json")
@@ -51,10 +51,9 @@ class WorldPkgLoader:
 
         transitions_path = self.path / "transitions" / "transitions.json"
         if transitions_path.exists():
-            raw = json.loads(transitions_path.read_text(encoding="utf-8"))
-            self.transitions: list[EventTransition] = [
-                EventTransition.model_validate(t) for t in raw["transitions"]
-            ]
+            self.transitions: list[EventTransition] = self._load(
+                TransitionData, "transitions/transitions.json"
+            ).transitions
         else:
             self.transitions: list[EventTransition] = []
 
@@ -62,17 +61,57 @@ class WorldPkgLoader:
         self._event_index: dict[str, Event] = {
             e.id: e for e in self.events.events
         }
-        self._sentence_index: dict[int, Sentence] = {
-            s.index: s for s in self.sentences.sentences
-        }
+        self._sentence_list: list[Sentence] = sorted(
+            self.sentences.sentences, key=lambda s: s.index
+        )
+        self._sentence_texts: list[str] = [s.text for s in self._sentence_list]
+        self._sentence_base = self._sentence_list[0].index if self._sentence_list else 0
+        self._sentences_contiguous = all(
+            s.index == self._sentence_base + i
+            for i, s in enumerate(self._sentence_list)
+        )
+        self._sentence_index: dict[int, Sentence] = (
+            {} if self._sentences_contiguous
+            else {s.index: s for s in self._sentence_list}
+        )
+        self._range_text_cache: dict[tuple[int, int], str] = {}
         self._transition_index: dict[str, EventTransition] = {
             t.event_id: t for t in self.transitions
         }
+        self._precondition_dicts: dict[str, list[dict]] = {
+            t.event_id: [p.model_dump(by_alias=True) for p in t.preconditions]
+            for t in self.transitions
+        }
+        self._protagonist: Character | None = next(
+            (
+                c for c in self.characters.characters
+                if c.importance == CharacterImportance.PROTAGONIST
+            ),
+            None,
+        )
+        self._ordered_events: list[Event] = sorted(
+            self.events.events,
+            key=lambda e: e.sentence_range[0] if e.sentence_range else float('inf')
+        )
+        self._next_event_index: dict[str, str] = {
+            prev.id: nxt.id
+            for prev, nxt in zip(self._ordered_events, self._ordered_events[1:])
+        }
 
     def get_event(self, event_id: str) -> Event | None:
         return self._event_index.get(event_id)
 
+    def _sentence_slice(self, start: int, end: int) -> slice | None:
+        if not self._sentences_contiguous:
+            return None
+        lo = max(start - self._sentence_base, 0)
+        hi = max(end - self._sentence_base + 1, 0)
+        return slice(lo, hi)
+
     def get_sentences_range(self, start: int, end: int) -> list[Sentence]:
+        window = self._sentence_slice(start, end)
+        if window is not None:
+            return self._sentence_list[window]
         return [
             self._sentence_index[i]
             for i in range(start, end + 1)
@@ -80,8 +119,16 @@ class WorldPkgLoader:
         ]
 
     def get_sentences_text(self, start: int, end: int) -> str:
-        sentences = self.get_sentences_range(start, end)
-        return "".join(s.text for s in sentences)
+        key = (start, end)
+        text = self._range_text_cache.get(key)
+        if text is None:
+            window = self._sentence_slice(start, end)
+            if window is not None:
+                text = "".join(self._sentence_texts[window])
+            else:
+                text = "".join(s.text for s in self.get_sentences_range(start, end))
+            self._range_text_cache[key] = text
+        return text
 
     def get_event_text_full(self, event_id: str) -> str:
         event = self.get_event(event_id)
@@ -99,27 +146,16 @@ class WorldPkgLoader:
         return event.decision_text
 
     def get_protagonist(self) -> Character | None:
-        for char in self.characters.characters:
-            if char.importance == CharacterImportance.PROTAGONIST:
-                return char
-        return None
+        return self._protagonist
 
     def get_events_by_order(self) -> list[Event]:
-        return sorted(
-            self.events.events,
-            key=lambda e: e.sentence_range[0] if e.sentence_range else float('inf')
-        )
+        return list(self._ordered_events)
 
     def get_first_event(self) -> Event | None:
-        ordered = self.get_events_by_order()
-        return ordered[0] if ordered else None
+        return self._ordered_events[0] if self._ordered_events else None
 
     def get_next_event_id(self, current_event_id: str) -> str | None:
-        ordered = self.get_events_by_order()
-        for i, event in enumerate(ordered):
-            if event.id == current_event_id and i + 1 < len(ordered):
-                return ordered[i + 1].id
-        return None
+        return self._next_event_index.get(current_event_id)
 
     def get_phase(self, event_id: str, phase_name: str) -> EventPhaseDetail | None:
         event = self.get_event(event_id)
@@ -148,3 +184,6 @@ class WorldPkgLoader:
     def get_preconditions(self, event_id: str) -> list[Precondition]:
         transition = self.get_transition(event_id)
         return transition.preconditions if transition else []
+
+    def get_precondition_dicts(self, event_id: str) -> list[dict]:
+        return self._precondition_dicts.get(event_id, [])